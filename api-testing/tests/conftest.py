@@ -0,0 +1,38 @@
+#tests/conftest.py
+"""
+Pytest hooks for API tests.
+
+- Reports how long collection took, so slow imports show up in every run.
+"""
+
+# Taken before any other import so the report includes this module's own
+# import cost (e.g. a heavy dependency imported at the top of this file).
+import time
+_CONFTEST_IMPORT_START = time.perf_counter()
+
+import pytest
+
+# The two hooks below are mirrored in ui-testing/tests/conftest.py. The suites are
+# installed and run independently, so there is no shared module to put them in.
+_COLLECTION_START = pytest.StashKey[float]()
+
+
+def pytest_collection(session):
+    session.config.stash[_COLLECTION_START] = time.perf_counter()
+
+
+def pytest_report_collectionfinish(config):
+    """
+    Report collection time next to pytest's 'collected N items' line.
+
+    The first number counts from the import of this conftest, so it includes
+    import-time cost of the harness; the second is pytest's collection phase alone.
+    """
+    now = time.perf_counter()
+    start = config.stash.get(_COLLECTION_START, None)
+    if start is None:
+        return f"collection took {now - _CONFTEST_IMPORT_START:.2f}s (including conftest import)"
+    return (
+        f"collection took {now - _CONFTEST_IMPORT_START:.2f}s including conftest import "
+        f"({now - start:.2f}s collection phase)"
+    )
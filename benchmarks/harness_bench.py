@@ -0,0 +1,462 @@
+# benchmarks/harness_bench.py
+
+"""
+Harness overhead benchmarks.
+
+Measures the time our own test harness spends outside the system under test:
+HTTP client creation, ChromeDriver installation, browser launch, the `driver`
+fixture, BasePage construction, test collection and HTML report writing.
+Everything runs against local stand-ins (see local_server.py), so the numbers
+do not depend on the network or on the live sites.
+
+Each benchmark is a generator, in the same style as a yield fixture:
+setup code runs before `yield step`, teardown after it, and only `step()`
+is timed.
+
+Usage (from the repository root):
+    python benchmarks/harness_bench.py                  # run and print statistics
+    python benchmarks/harness_bench.py --save-baseline  # record benchmarks/baseline.json
+    python benchmarks/harness_bench.py --only NAME --save-baseline  # update one entry
+    python benchmarks/harness_bench.py --compare        # exit 1 if slower than the baseline
+
+Benchmarks whose dependencies are not installed are skipped. --compare still
+fails if a skipped benchmark is in the baseline, unless --only left it out, and
+--save-baseline refuses to write while anything was skipped or errored.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from local_server import LocalServer
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+UI_TESTING_DIR = os.path.join(REPO_ROOT, "ui-testing")
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+
+# A benchmark regresses when its median grows by more than this fraction...
+DEFAULT_THRESHOLD = 0.20
+# ...and by more than this many seconds, so sub-millisecond noise never fails a run.
+MIN_DELTA_SECONDS = 0.001
+
+WARMUP_RUNS = 1
+
+# Trivial test module used to time a pytest session with and without --html.
+SAMPLE_TEST = '''
+import pytest
+
+@pytest.mark.parametrize("n", range(20))
+def test_sample(n):
+    assert n >= 0
+'''
+
+
+class Benchmark:
+    def __init__(self, name, func, requires, repeat):
+        self.name = name
+        self.func = func
+        self.requires = requires
+        self.repeat = repeat
+        self.description = (func.__doc__ or "").strip().split("\n")[0]
+
+    def missing_requirements(self):
+        """Return the required modules that are not importable."""
+        return [module for module in self.requires if importlib.util.find_spec(module) is None]
+
+
+BENCHMARKS = []
+
+
+def benchmark(name, requires=(), repeat=10):
+    """Register a generator function as a benchmark."""
+    def register(func):
+        BENCHMARKS.append(Benchmark(name, func, tuple(requires), repeat))
+        return func
+    return register
+
+
+class BenchEnv:
+    """Shared state handed to every benchmark: stand-in URLs and scratch paths."""
+
+    def __init__(self, base_url, work_dir):
+        self.base_url = base_url
+        self.work_dir = work_dir
+        self.sample_tests_dir = os.path.join(work_dir, "sample_tests")
+        os.makedirs(self.sample_tests_dir, exist_ok=True)
+        with open(os.path.join(self.sample_tests_dir, "test_sample.py"), "w") as fh:
+            fh.write(SAMPLE_TEST)
+
+
+def _import_ui_harness():
+    """Import the UI conftest helpers and BasePage the same way pytest does."""
+    if UI_TESTING_DIR not in sys.path:
+        sys.path.insert(0, UI_TESTING_DIR)
+    from tests import conftest
+    from tests.ui.pages.base_page import BasePage
+    return conftest, BasePage
+
+
+def _run_pytest(args, cwd):
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+    # 0 = passed, 5 = nothing collected; anything else means the benchmark is invalid
+    if result.returncode not in (0, 5):
+        raise RuntimeError(f"pytest exited with {result.returncode}:\n{result.stdout}{result.stderr}")
+
+
+# ---------------------------------------------------------------------------
+# HTTP client (api-testing)
+# ---------------------------------------------------------------------------
+
+@benchmark("http_client_create", requires=("requests",), repeat=200)
+def bench_http_client_create(env):
+    """Create and close a requests.Session."""
+    import requests
+
+    def step():
+        requests.Session().close()
+    yield step
+
+
+@benchmark("http_get_new_connection", requires=("requests",), repeat=50)
+def bench_http_get_new_connection(env):
+    """GET /users with requests.get, opening a new connection each time (current tests)."""
+    import requests
+
+    url = f"{env.base_url}/users"
+
+    def step():
+        requests.get(url, timeout=10).json()
+    yield step
+
+
+@benchmark("http_get_reused_session", requires=("requests",), repeat=50)
+def bench_http_get_reused_session(env):
+    """GET /users through one shared requests.Session (connection reuse)."""
+    import requests
+
+    url = f"{env.base_url}/users"
+    session = requests.Session()
+
+    def step():
+        session.get(url, timeout=10).json()
+    yield step
+    session.close()
+
+
+# ---------------------------------------------------------------------------
+# Browser (ui-testing)
+# ---------------------------------------------------------------------------
+
+@benchmark("chromedriver_install", requires=("webdriver_manager",), repeat=5)
+def bench_chromedriver_install(env):
+    """ChromeDriverManager().install(), as called by every driver fixture."""
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    def step():
+        ChromeDriverManager().install()
+    yield step
+
+
+@benchmark("browser_launch", requires=("selenium", "webdriver_manager"), repeat=5)
+def bench_browser_launch(env):
+    """Launch and quit Chrome with an already installed ChromeDriver."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    conftest, _ = _import_ui_harness()
+    driver_path = ChromeDriverManager().install()
+
+    def step():
+        webdriver.Chrome(service=Service(driver_path), options=conftest.chrome_options()).quit()
+    yield step
+
+
+@benchmark("driver_fixture", requires=("selenium", "webdriver_manager"), repeat=5)
+def bench_driver_fixture(env):
+    """Full `driver` fixture setup and teardown (install + launch + quit)."""
+    conftest, _ = _import_ui_harness()
+
+    def step():
+        conftest.create_chrome_driver().quit()
+    yield step
+
+
+@benchmark("base_page_init", requires=("selenium", "webdriver_manager"), repeat=200)
+def bench_base_page_init(env):
+    """Construct a BasePage (including its WebDriverWait) on a running driver."""
+    conftest, BasePage = _import_ui_harness()
+    driver = conftest.create_chrome_driver()
+
+    def step():
+        BasePage(driver, env.base_url)
+    yield step
+    driver.quit()
+
+
+@benchmark("base_page_open_local", requires=("selenium", "webdriver_manager"), repeat=20)
+def bench_base_page_open_local(env):
+    """BasePage.open() on the local static page and wait for its heading."""
+    from selenium.webdriver.common.by import By
+
+    conftest, BasePage = _import_ui_harness()
+    driver = conftest.create_chrome_driver()
+    page = BasePage(driver, env.base_url)
+
+    def step():
+        page.open("/solutions/")
+        page.wait_for_visible((By.TAG_NAME, "h1"))
+    yield step
+    driver.quit()
+
+
+# ---------------------------------------------------------------------------
+# pytest session (collection and reporting)
+# ---------------------------------------------------------------------------
+
+@benchmark("ui_collection", requires=("pytest",), repeat=5)
+def bench_ui_collection(env):
+    """`pytest --collect-only` on the ui-testing suite."""
+    def step():
+        _run_pytest(["--collect-only"], cwd=UI_TESTING_DIR)
+    yield step
+
+
+@benchmark("pytest_session_plain", requires=("pytest",), repeat=5)
+def bench_pytest_session_plain(env):
+    """Run 20 trivial tests without an HTML report."""
+    def step():
+        _run_pytest([env.sample_tests_dir], cwd=env.work_dir)
+    yield step
+
+
+@benchmark("pytest_session_html", requires=("pytest", "pytest_html"), repeat=5)
+def bench_pytest_session_html(env):
+    """Run 20 trivial tests and write a self-contained HTML report."""
+    report = os.path.join(env.work_dir, "report.html")
+
+    def step():
+        _run_pytest(
+            [env.sample_tests_dir, f"--html={report}", "--self-contained-html"],
+            cwd=env.work_dir,
+        )
+    yield step
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def summarize(samples):
+    """Basic statistics (in seconds) for a list of timings."""
+    return {
+        "runs": len(samples),
+        "min": min(samples),
+        "max": max(samples),
+        "mean": statistics.mean(samples),
+        "median": statistics.median(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def run_benchmark(bench, env, repeat=None):
+    """Run one benchmark: warm up, then time `repeat` calls of its step."""
+    gen = bench.func(env)
+    step = next(gen)
+    try:
+        for _ in range(WARMUP_RUNS):
+            step()
+        samples = []
+        for _ in range(repeat or bench.repeat):
+            start = time.perf_counter()
+            step()
+            samples.append(time.perf_counter() - start)
+    finally:
+        # Resume the generator so its teardown (code after `yield`) runs.
+        next(gen, None)
+    return summarize(samples)
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD, expected=None):
+    """
+    Compare medians against a baseline.
+
+    Returns (regressions, missing):
+    - regressions: (name, baseline_median, current_median) for benchmarks that got
+      slower by more than `threshold` (fraction) and MIN_DELTA_SECONDS.
+    - missing: names from `expected` (default: every baseline benchmark) that have
+      no current result, e.g. skipped for a missing dependency or errored.
+    Results without a baseline entry are ignored.
+    """
+    if expected is None:
+        expected = list(baseline)
+    regressions = []
+    for name, stats in results.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]["median"]
+        current = stats["median"]
+        if current - base > max(base * threshold, MIN_DELTA_SECONDS):
+            regressions.append((name, base, current))
+    missing = [name for name in expected if name in baseline and name not in results]
+    return regressions, missing
+
+
+def load_baseline(path):
+    with open(path) as fh:
+        return json.load(fh)["benchmarks"]
+
+
+def save_baseline(path, results, merge=False):
+    """
+    Write `results` to the baseline file.
+
+    With `merge`, entries already in the file are kept and only the benchmarks
+    in `results` are replaced (used with --only).
+    """
+    benchmarks = {}
+    if merge and os.path.exists(path):
+        benchmarks = load_baseline(path)
+    benchmarks.update(results)
+    data = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "benchmarks": benchmarks,
+    }
+    with open(path, "w") as fh:
+        json.dump(data, fh, indent=2, sort_keys=True)
+        fh.write("\n")
+
+
+def _ms(seconds):
+    return f"{seconds * 1000:10.2f}"
+
+
+def print_results(results, baseline=None):
+    header = f"{'benchmark':<26}{'runs':>6}{'median ms':>11}{'mean ms':>11}{'stdev ms':>11}{'min ms':>11}{'max ms':>11}"
+    if baseline is not None:
+        header += f"{'base ms':>11}{'change':>9}"
+    print(header)
+    print("-" * len(header))
+    for name, stats in results.items():
+        line = (
+            f"{name:<26}{stats['runs']:>6} {_ms(stats['median'])} {_ms(stats['mean'])} "
+            f"{_ms(stats['stdev'])} {_ms(stats['min'])} {_ms(stats['max'])}"
+        )
+        if baseline is not None and name in baseline:
+            base = baseline[name]["median"]
+            change = (stats["median"] - base) / base * 100 if base else 0.0
+            line += f" {_ms(base)} {change:+7.1f}%"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure test harness overhead against local stand-ins.")
+    parser.add_argument("--only", action="append", metavar="NAME",
+                        help="run only this benchmark (repeatable)")
+    parser.add_argument("--repeat", type=int, help="override the number of timed runs per benchmark")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline file (default: %(default)s)")
+    parser.add_argument("--save-baseline", action="store_true", help="write results to the baseline file")
+    parser.add_argument("--compare", action="store_true",
+                        help="fail if any benchmark regressed past --threshold")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown as a fraction of the baseline median (default: %(default)s)")
+    parser.add_argument("--list", action="store_true", help="list benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for bench in BENCHMARKS:
+            print(f"{bench.name:<26}{bench.description}")
+        return 0
+
+    selected = BENCHMARKS
+    if args.only:
+        known = {bench.name for bench in BENCHMARKS}
+        unknown = [name for name in args.only if name not in known]
+        if unknown:
+            parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+        selected = [bench for bench in BENCHMARKS if bench.name in args.only]
+
+    baseline = None
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            parser.error(f"no baseline at {args.baseline}; record one with --save-baseline first")
+        baseline = load_baseline(args.baseline)
+
+    results = {}
+    skipped = []
+    errors = []
+    with LocalServer() as server, tempfile.TemporaryDirectory() as work_dir:
+        env = BenchEnv(server.url, work_dir)
+        for bench in selected:
+            missing = bench.missing_requirements()
+            if missing:
+                print(f"SKIP  {bench.name}: not installed: {', '.join(missing)}")
+                skipped.append(bench.name)
+                continue
+            try:
+                results[bench.name] = run_benchmark(bench, env, args.repeat)
+            except Exception as exc:
+                print(f"ERROR {bench.name}: {exc}")
+                errors.append(bench.name)
+
+    print()
+    print_results(results, baseline)
+
+    failed = bool(errors)
+
+    if baseline is not None:
+        # Benchmarks left out with --only are deliberate; anything else in the
+        # baseline must have run, or the comparison would pass without checking it.
+        selected_names = {bench.name for bench in selected}
+        expected = [name for name in baseline if name in selected_names]
+        regressions, missing = compare(results, baseline, args.threshold, expected)
+        compared = [name for name in expected if name in results]
+        if regressions:
+            print(f"\nHarness overhead regressed past {args.threshold:.0%}:")
+            for name, base, current in regressions:
+                print(f"  {name}: {base * 1000:.2f} ms -> {current * 1000:.2f} ms")
+            failed = True
+        if missing:
+            print(f"\nIn the baseline but not measured (skipped or errored): {', '.join(missing)}")
+            failed = True
+        if not compared:
+            print(f"\nNothing was compared: no selected benchmark has a result and a baseline in {args.baseline}")
+            failed = True
+        if not failed:
+            print(f"\nNo regressions past {args.threshold:.0%} ({len(compared)} benchmarks compared).")
+
+    if args.save_baseline:
+        not_run = skipped + errors
+        if not_run:
+            print(
+                f"\nBaseline not written: {', '.join(not_run)} did not run. "
+                "Install the missing dependencies, or use --only to update the other benchmarks."
+            )
+            return 1
+        save_baseline(args.baseline, results, merge=bool(args.only))
+        action = "updated" if args.only else "written"
+        print(f"\nBaseline {action}: {args.baseline}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+# benchmarks/local_server.py
+
+"""
+Local stand-ins for the systems under test.
+
+A small threaded HTTP server that mimics the JSONPlaceholder endpoints used by
+the API tests and serves a static page shaped like the DaveAI pages used by the
+UI tests. Benchmarks run against it so timings reflect our harness, not the network.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+USERS = [
+    {"id": i, "name": f"User {i}", "email": f"user{i}@example.com"}
+    for i in range(1, 11)
+]
+
+# Same elements the page objects look for: h1, the 'Book Demo' CTA and a form wrapper.
+STATIC_PAGE = """<!DOCTYPE html>
+<html>
+<head><title>DaveAI - Local Stand-in</title></head>
+<body>
+  <h1>Solutions for Sales</h1>
+  <a class="elementor-button" href="/contact-us/">Book Demo</a>
+  <div class="elementor-form-fields-wrapper"><input name="email"></div>
+</body>
+</html>
+"""
+
+PAGE_PATHS = ("/", "/solutions/", "/contact-us/")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections alive, so connection reuse is measurable.
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path in PAGE_PATHS:
+            self._send(200, STATIC_PAGE.encode("utf-8"), "text/html; charset=utf-8")
+        elif self.path == "/users":
+            self._send_json(200, USERS)
+        elif self.path.startswith("/users/"):
+            user_id = self.path.rsplit("/", 1)[-1]
+            user = next((u for u in USERS if str(u["id"]) == user_id), None)
+            self._send_json(200 if user else 404, user or {})
+        else:
+            self._send_json(404, {})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        raw = self.rfile.read(length) if length else b""
+        if self.path == "/posts":
+            payload = json.loads(raw) if raw else {}
+            self._send_json(201, {**payload, "id": 101})
+        else:
+            self._send_json(404, {})
+
+    def _send_json(self, status, body):
+        self._send(status, json.dumps(body).encode("utf-8"), "application/json")
+
+    def _send(self, status, data, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        # Per-request logging would dominate the timings we are trying to measure.
+        pass
+
+
+class LocalServer:
+    """
+    Run the stand-in server on a free localhost port in a background thread.
+
+    Usage:
+        with LocalServer() as server:
+            requests.get(f"{server.url}/users")
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self._thread.join()
@@ -0,0 +1,135 @@
+# benchmarks/test_harness_bench.py
+
+"""
+Tests for the benchmark runner itself: statistics, baseline comparison and
+the local stand-in server. They need nothing beyond pytest.
+"""
+
+import json
+import urllib.request
+
+import pytest
+
+import harness_bench
+from harness_bench import Benchmark, compare, run_benchmark, summarize
+from local_server import LocalServer
+
+
+def _stats(median):
+    return {"runs": 5, "min": median, "max": median, "mean": median, "median": median, "stdev": 0.0}
+
+
+@pytest.mark.smoke
+def test_summarize_reports_basic_statistics():
+    stats = summarize([0.1, 0.2, 0.3, 0.4])
+
+    assert stats["runs"] == 4
+    assert stats["min"] == 0.1
+    assert stats["max"] == 0.4
+    assert stats["mean"] == pytest.approx(0.25)
+    assert stats["median"] == pytest.approx(0.25)
+    assert stats["stdev"] > 0
+
+
+def test_summarize_single_sample_has_zero_stdev():
+    assert summarize([0.5])["stdev"] == 0.0
+
+
+@pytest.mark.smoke
+def test_compare_flags_only_regressions_past_threshold():
+    baseline = {"fast": _stats(0.100), "slow": _stats(0.100)}
+    results = {"fast": _stats(0.110), "slow": _stats(0.150), "new": _stats(9.0)}
+
+    regressions, missing = compare(results, baseline, threshold=0.20)
+
+    assert regressions == [("slow", 0.100, 0.150)]
+    assert missing == []
+
+
+@pytest.mark.smoke
+def test_compare_reports_baseline_benchmarks_without_results():
+    baseline = {"ran": _stats(0.100), "skipped": _stats(0.100), "left_out": _stats(0.100)}
+    results = {"ran": _stats(0.100)}
+
+    _, missing = compare(results, baseline)
+    assert missing == ["skipped", "left_out"]
+
+    # names deliberately excluded (e.g. by --only) are not expected
+    _, missing = compare(results, baseline, expected=["ran", "skipped"])
+    assert missing == ["skipped"]
+
+
+def test_compare_ignores_sub_millisecond_noise():
+    # +100% but well below MIN_DELTA_SECONDS
+    regressions, _ = compare({"tiny": _stats(0.0002)}, {"tiny": _stats(0.0001)}, threshold=0.20)
+
+    assert regressions == []
+
+
+def test_main_compare_fails_when_nothing_overlaps(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    harness_bench.save_baseline(str(baseline), {"ui_collection": _stats(0.1)})
+
+    exit_code = harness_bench.main(
+        ["--only", "pytest_session_plain", "--repeat", "1", "--compare", "--baseline", str(baseline)]
+    )
+
+    assert exit_code == 1
+
+
+def test_run_benchmark_times_step_and_runs_teardown():
+    calls = []
+
+    def bench(env):
+        calls.append("setup")
+        yield lambda: calls.append("step")
+        calls.append("teardown")
+
+    stats = run_benchmark(Benchmark("sample", bench, (), repeat=3), env=None)
+
+    assert stats["runs"] == 3
+    # one warm-up call plus the timed runs
+    assert calls == ["setup"] + ["step"] * (harness_bench.WARMUP_RUNS + 3) + ["teardown"]
+
+
+def test_save_and_load_baseline_round_trip(tmp_path):
+    path = tmp_path / "baseline.json"
+    harness_bench.save_baseline(str(path), {"sample": _stats(0.1)})
+
+    assert harness_bench.load_baseline(str(path)) == {"sample": _stats(0.1)}
+    assert "python" in json.loads(path.read_text())["meta"]
+
+
+def test_save_baseline_merge_keeps_other_entries(tmp_path):
+    path = tmp_path / "baseline.json"
+    harness_bench.save_baseline(str(path), {"a": _stats(0.1), "b": _stats(0.1)})
+
+    harness_bench.save_baseline(str(path), {"b": _stats(0.2)}, merge=True)
+
+    assert harness_bench.load_baseline(str(path)) == {"a": _stats(0.1), "b": _stats(0.2)}
+
+
+def test_main_refuses_to_save_when_a_benchmark_errors(tmp_path, monkeypatch):
+    path = tmp_path / "baseline.json"
+
+    def broken(env):
+        raise RuntimeError("boom")
+        yield
+
+    monkeypatch.setattr(harness_bench, "BENCHMARKS", [Benchmark("broken", broken, (), repeat=1)])
+
+    exit_code = harness_bench.main(["--save-baseline", "--baseline", str(path)])
+
+    assert exit_code == 1
+    assert not path.exists()
+
+
+def test_local_server_serves_api_and_static_page():
+    with LocalServer() as server:
+        with urllib.request.urlopen(f"{server.url}/users", timeout=5) as resp:
+            users = json.loads(resp.read())
+        with urllib.request.urlopen(f"{server.url}/solutions/", timeout=5) as resp:
+            page = resp.read().decode("utf-8")
+
+    assert len(users) > 0
+    assert "<h1>" in page and "Book Demo" in page
@@ -3,15 +3,47 @@
 Pytest fixtures for UI tests.
 
 - driver: creates a Chrome WebDriver using webdriver-manager.
+- home_page / solutions_page / contact_page: page objects bound to the driver.
 - base_url: can be overridden with the BASE_URL environment variable.
 - HEADLESS behavior can be toggled with HEADLESS env var (default is true).
+
+Selenium and webdriver-manager are imported inside the fixtures that need them,
+so collection (and marker-filtered runs that select no UI tests) stays fast.
 """
 
+# Taken before any other import so the report includes this module's own
+# import cost (e.g. a heavy dependency imported at the top of this file).
+import time
+_CONFTEST_IMPORT_START = time.perf_counter()
+
 import os
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+
+# The two hooks below are mirrored in api-testing/tests/conftest.py. The suites are
+# installed and run independently, so there is no shared module to put them in.
+_COLLECTION_START = pytest.StashKey[float]()
+
+
+def pytest_collection(session):
+    session.config.stash[_COLLECTION_START] = time.perf_counter()
+
+
+def pytest_report_collectionfinish(config):
+    """
+    Report collection time next to pytest's 'collected N items' line.
+
+    The first number counts from the import of this conftest, so it includes
+    import-time cost of the harness; the second is pytest's collection phase alone.
+    """
+    now = time.perf_counter()
+    start = config.stash.get(_COLLECTION_START, None)
+    if start is None:
+        return f"collection took {now - _CONFTEST_IMPORT_START:.2f}s (including conftest import)"
+    return (
+        f"collection took {now - _CONFTEST_IMPORT_START:.2f}s including conftest import "
+        f"({now - start:.2f}s collection phase)"
+    )
+
 
 @pytest.fixture(scope="session")
 def base_url():
@@ -19,14 +51,15 @@ def base_url():
     return os.environ.get("BASE_URL", "https://www.iamdave.ai")
 
 
-@pytest.fixture
-def driver():
+def chrome_options():
     """
-    Instantiate Chrome WebDriver.
+    Build ChromeOptions for the test browser.
 
     Environment variables:
     - HEADLESS (true/false) to toggle headless mode. Default: true.
     """
+    from selenium import webdriver
+
     headless_env = os.environ.get("HEADLESS", "true").lower()
     headless = headless_env not in ("0", "false", "no")
 
@@ -39,13 +72,54 @@ def driver():
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-gpu")  # harmless even if not used
+    return options
+
+
+def create_chrome_driver():
+    """
+    Install (or reuse the cached) ChromeDriver and launch Chrome.
+
+    Kept separate from the `driver` fixture so benchmarks/harness_bench.py can
+    measure exactly what each UI test pays for.
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
 
     driver = webdriver.Chrome(
         service=Service(ChromeDriverManager().install()),
-        options=options
+        options=chrome_options()
     )
 
     # A modest implicit wait helps with simple timing issues; explicit waits are used in pages.
     driver.implicitly_wait(5)
+    return driver
+
+
+@pytest.fixture
+def driver():
+    """Instantiate Chrome WebDriver (see chrome_options for HEADLESS)."""
+    driver = create_chrome_driver()
     yield driver
     driver.quit()
+
+
+@pytest.fixture
+def home_page(driver, base_url):
+    """HomePage object for the current driver."""
+    from tests.ui.pages.home_page import HomePage
+    return HomePage(driver, base_url)
+
+
+@pytest.fixture
+def solutions_page(driver, base_url):
+    """SolutionsPage object for the current driver."""
+    from tests.ui.pages.solutions_page import SolutionsPage
+    return SolutionsPage(driver, base_url)
+
+
+@pytest.fixture
+def contact_page(driver, base_url):
+    """ContactPage object for the current driver."""
+    from tests.ui.pages.contact_page import ContactPage
+    return ContactPage(driver, base_url)
@@ -0,0 +1,41 @@
+#tests/test_collection.py
+
+"""
+Guards for the test harness itself.
+
+Collecting the UI suite must not import Selenium or webdriver-manager;
+those are loaded by the fixtures that need them.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+UI_TESTING_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("selenium", "webdriver_manager")
+
+
+@pytest.mark.smoke
+def test_importing_test_modules_does_not_load_selenium():
+    """
+    Import conftest and every UI test module in a fresh interpreter and check
+    that no heavy dependency ended up in sys.modules.
+    """
+    code = (
+        "import sys\n"
+        "import tests.conftest, tests.ui.test_iamdave_ui, tests.ui.simple_ui_test\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=UI_TESTING_DIR,
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+
+    assert result.returncode == 0, f"Importing test modules failed:\n{result.stderr}"
+    assert result.stdout.strip() == "", f"Loaded at import time: {result.stdout.strip()}"
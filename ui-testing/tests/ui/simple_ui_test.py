@@ -1,58 +1,59 @@
 #tests/simple_ui_test.py
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-import time
+"""
+Simple UI checks written without page objects.
 
-#Launch browser
-driver = webdriver.Chrome()
-driver.maximize_window()
+Each test maps directly to a manual test case. They use the shared `driver`
+fixture, so nothing is launched when this module is imported or collected.
+"""
+
+import pytest
 
-#open application URL
-driver.get("https://www.iamdave.ai")
 
 # Test case 1: verify Home Page Title
-print("Running Test Case Verify Home Page Title")
+@pytest.mark.ui
+def test_home_page_title(driver, base_url):
+    driver.get(base_url)
+
+    title = driver.title
+    assert "Dave" in title or "DaveAI" in title, f"Unexpected title: {title}"
+
 
-title = driver.title
-assert "Dave" in title or "DaveAI" in title, f"Unexpected title: {title}"
-print("Home page title verified successfully")
+# Test case 2: navigate to solutions Page
+@pytest.mark.ui
+def test_navigate_to_solutions_page(driver, base_url):
+    from selenium.webdriver.common.by import By
 
-# Test case 2: navigate to solutions Page 
-print("Running Test Case: Navigate to Solutions Page")
+    driver.get(f"{base_url}/solutions/")
 
-driver.get("https://www.iamdave.ai/solutions/")
-time.sleep(3)
+    heading = driver.find_element(By.TAG_NAME, "h1").text.lower()
+    assert "solutions" in heading or "sales" in heading, f"Unexpected heading: {heading}"
 
-heading = driver.find_element(By.TAG_NAME, "h1").text.lower()
-assert "solutions" in heading or "sales" in heading, f"Unexpected heading: {heading}"
-print("Solutions page navigation verified")
 
-# Test case 3: verify Book Demo CTA 
-print("Running Test Case: Verify Book Demo CTA")
+# Test case 3: verify Book Demo CTA
+@pytest.mark.ui
+def test_book_demo_cta_visible(driver, base_url):
+    from selenium.webdriver.common.by import By
 
-cta_button = driver.find_element(
-    By.XPATH, "//a[contains(@class, 'elementor-button') and contains(., 'Book Demo')]"
-)
-assert cta_button.is_displayed(), "Book Demo CTA is not visible"
-print("CTA button is visible")
+    driver.get(f"{base_url}/solutions/")
 
-#  Test case 4: navigate to ContactPage 
-print("running testcase: navigate to contactpage")
+    cta_button = driver.find_element(
+        By.XPATH, "//a[contains(@class, 'elementor-button') and contains(., 'Book Demo')]"
+    )
+    assert cta_button.is_displayed(), "Book Demo CTA is not visible"
 
-driver.get("https://www.iamdave.ai/contact-us/")
-time.sleep(3)
 
-contact_heading = driver.find_element(By.TAG_NAME, "h1")
-assert contact_heading.is_displayed(), "contactpage heading not visible"
+# Test case 4: navigate to ContactPage
+@pytest.mark.ui
+def test_contact_page_loads(driver, base_url):
+    from selenium.webdriver.common.by import By
 
-contact_form = driver.find_element(
-    By.XPATH, "//div[contains(@class, 'elementor-form') or contains(@class, 'wpcf7-form')]"
-)
-assert contact_form.is_displayed(), "contact form not visible"
+    driver.get(f"{base_url}/contact-us/")
 
-print("contact page verified successfully")
+    contact_heading = driver.find_element(By.TAG_NAME, "h1")
+    assert contact_heading.is_displayed(), "contactpage heading not visible"
 
-# close browser
-driver.quit()
-print("All tests case passed")
+    contact_form = driver.find_element(
+        By.XPATH, "//div[contains(@class, 'elementor-form') or contains(@class, 'wpcf7-form')]"
+    )
+    assert contact_form.is_displayed(), "contact form not visible"